@@ -3,7 +3,8 @@ Shared constants for the app.
 All layout, font, and color settings are centralized here.
 """
 
-from PySide6.QtCore import Qt
+from functools import lru_cache
+
 from PySide6.QtGui import QColor
 
 # Window
@@ -22,23 +23,41 @@ TICK_WIDTH_MINOR = 1
 
 MAX_DIAL_MIN = 60
 
+# Palette (RGB(A) tuples, shared with the "dark" theme)
+_RGB_BG_OUTER = (28, 30, 34)
+_RGB_BG_DISC = (38, 41, 46)
+_RGB_BG_INNER = (32, 34, 38)
+
+_RGB_ARC_WORK = (229, 75, 75)
+_RGB_ARC_SHORT = (60, 180, 140)
+_RGB_ARC_LONG = (70, 145, 220)
+
+_RGB_TICK_MAJOR = (90, 95, 105)
+_RGB_TICK_MINOR = (55, 58, 64)
+
+_RGB_TEXT_TIME = (240, 240, 245)
+_RGB_TEXT_MODE = (120, 125, 135)
+_RGB_TEXT_SET = (90, 95, 105)
+
+_RGB_SHADOW = (0, 0, 0, 80)
+
 # Palette (QColor)
-C_BG_OUTER = QColor(28, 30, 34)
-C_BG_DISC = QColor(38, 41, 46)
-C_BG_INNER = QColor(32, 34, 38)
+C_BG_OUTER = QColor(*_RGB_BG_OUTER)
+C_BG_DISC = QColor(*_RGB_BG_DISC)
+C_BG_INNER = QColor(*_RGB_BG_INNER)
 
-C_ARC_WORK = QColor(229, 75, 75)
-C_ARC_SHORT = QColor(60, 180, 140)
-C_ARC_LONG = QColor(70, 145, 220)
+C_ARC_WORK = QColor(*_RGB_ARC_WORK)
+C_ARC_SHORT = QColor(*_RGB_ARC_SHORT)
+C_ARC_LONG = QColor(*_RGB_ARC_LONG)
 
-C_TICK_MAJOR = QColor(90, 95, 105)
-C_TICK_MINOR = QColor(55, 58, 64)
+C_TICK_MAJOR = QColor(*_RGB_TICK_MAJOR)
+C_TICK_MINOR = QColor(*_RGB_TICK_MINOR)
 
-C_TEXT_TIME = QColor(240, 240, 245)
-C_TEXT_MODE = QColor(120, 125, 135)
-C_TEXT_SET = QColor(90, 95, 105)
+C_TEXT_TIME = QColor(*_RGB_TEXT_TIME)
+C_TEXT_MODE = QColor(*_RGB_TEXT_MODE)
+C_TEXT_SET = QColor(*_RGB_TEXT_SET)
 
-C_SHADOW = QColor(0, 0, 0, 80)
+C_SHADOW = QColor(*_RGB_SHADOW)
 
 # Fonts
 FONT_FAMILY = "Segoe UI"
@@ -70,49 +89,59 @@ MODE_COLORS = {
 }
 
 # Themes
+# Colors are stored as RGB(A) tuples; get_theme() builds the QColors for
+# the selected theme only.
 DEFAULT_THEME = "midnight_gold"
 
 THEMES = {
     "midnight_gold": {
         "label": "Midnight Gold",
-        "bg_outer": QColor(15, 52, 67),  # #0F3443
-        "bg_disc": QColor(23, 58, 70),
-        "bg_inner": QColor(11, 40, 50),
-        "arc": QColor(180, 154, 82),  # #B49A52
-        "tick_major": QColor(255, 255, 255),
-        "tick_minor": QColor(220, 220, 220),
-        "text_time": QColor(255, 255, 255),
-        "text_mode": QColor(255, 255, 255),
-        "text_set": QColor(230, 211, 154),  # #E6D39A
-        "hand": QColor(230, 211, 154),
-        "shadow": QColor(0, 0, 0, 80),
+        "bg_outer": (15, 52, 67),  # #0F3443
+        "bg_disc": (23, 58, 70),
+        "bg_inner": (11, 40, 50),
+        "arc": (180, 154, 82),  # #B49A52
+        "tick_major": (255, 255, 255),
+        "tick_minor": (220, 220, 220),
+        "text_time": (255, 255, 255),
+        "text_mode": (255, 255, 255),
+        "text_set": (230, 211, 154),  # #E6D39A
+        "hand": (230, 211, 154),
+        "shadow": (0, 0, 0, 80),
     },
     "dark": {
         "label": "Dark",
-        "bg_outer": C_BG_OUTER,
-        "bg_disc": C_BG_DISC,
-        "bg_inner": C_BG_INNER,
-        "arc": C_ARC_WORK,
-        "tick_major": C_TICK_MAJOR,
-        "tick_minor": C_TICK_MINOR,
-        "text_time": C_TEXT_TIME,
-        "text_mode": C_TEXT_MODE,
-        "text_set": C_TEXT_SET,
-        "hand": QColor(240, 240, 245),
-        "shadow": C_SHADOW,
+        "bg_outer": _RGB_BG_OUTER,
+        "bg_disc": _RGB_BG_DISC,
+        "bg_inner": _RGB_BG_INNER,
+        "arc": _RGB_ARC_WORK,
+        "tick_major": _RGB_TICK_MAJOR,
+        "tick_minor": _RGB_TICK_MINOR,
+        "text_time": _RGB_TEXT_TIME,
+        "text_mode": _RGB_TEXT_MODE,
+        "text_set": _RGB_TEXT_SET,
+        "hand": _RGB_TEXT_TIME,
+        "shadow": _RGB_SHADOW,
     },
     "light": {
         "label": "Light",
-        "bg_outer": QColor(240, 242, 246),
-        "bg_disc": QColor(225, 228, 234),
-        "bg_inner": QColor(250, 250, 252),
-        "arc": QColor(96, 120, 160),
-        "tick_major": QColor(80, 85, 95),
-        "tick_minor": QColor(130, 135, 145),
-        "text_time": QColor(40, 42, 46),
-        "text_mode": QColor(70, 75, 85),
-        "text_set": QColor(90, 95, 105),
-        "hand": QColor(40, 42, 46),
-        "shadow": QColor(0, 0, 0, 50),
+        "bg_outer": (240, 242, 246),
+        "bg_disc": (225, 228, 234),
+        "bg_inner": (250, 250, 252),
+        "arc": (96, 120, 160),
+        "tick_major": (80, 85, 95),
+        "tick_minor": (130, 135, 145),
+        "text_time": (40, 42, 46),
+        "text_mode": (70, 75, 85),
+        "text_set": (90, 95, 105),
+        "hand": (40, 42, 46),
+        "shadow": (0, 0, 0, 50),
     },
-}
+}
+
+
+@lru_cache(maxsize=None)
+def get_theme(name: str) -> dict:
+    """Return the theme with QColor values, filled in from the default theme."""
+    spec = dict(THEMES[DEFAULT_THEME])
+    spec.update(THEMES.get(name, {}))
+    return {k: QColor(*v) if isinstance(v, tuple) else v for k, v in spec.items()}
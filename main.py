@@ -7,36 +7,43 @@ from pathlib import Path
 import traceback
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QIcon
+
+_BASE_DIR = Path(__file__).resolve().parent
 
 # Ensure settings.json is stored in this directory.
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(_BASE_DIR))
 
-from settings import Settings
-from ui_widget import PomodoroWidget
-from notifier import prewarm_sounds, init_tray
-
-from PySide6.QtGui import QIcon
 
 def main() -> None:
     try:
-        # Enable high-DPI scaling (Qt6 default, but explicit is safe).
-        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
-
         app = QApplication.instance() or QApplication(sys.argv)
         app.setApplicationName("PomodoroTimer")
         app.setOrganizationName("PomoApp")
 
-        icon_path = Path(__file__).resolve().parent / "assets" / "icon.ico"
+        icon_path = _BASE_DIR / "assets" / "icon.ico"
         app.setWindowIcon(QIcon(str(icon_path)))
-        
+
+        # Deferred until the QApplication exists so the event loop can start
+        # while the heavier widget/settings import chain resolves.
+        from settings import Settings
+        from ui_widget import PomodoroWidget
+
         settings = Settings()
 
         widget = PomodoroWidget(settings)
         widget.setWindowIcon(QIcon(str(icon_path)))
         widget.show()
-        init_tray(str(icon_path))
-        prewarm_sounds()
+
+        def _late_init() -> None:
+            # Tray and sound prewarm are not needed for the first paint.
+            from notifier import prewarm_sounds, init_tray
+
+            init_tray(str(icon_path))
+            prewarm_sounds()
+
+        QTimer.singleShot(0, _late_init)
 
         def on_quit() -> None:
             settings.save()
@@ -44,7 +51,7 @@ def main() -> None:
         app.aboutToQuit.connect(on_quit)
         sys.exit(app.exec())
     except Exception:
-        crash_path = Path(__file__).resolve().parent / "crash.log"
+        crash_path = _BASE_DIR / "crash.log"
         try:
             crash_path.write_text(traceback.format_exc(), encoding="utf-8")
         except Exception:
@@ -1,13 +1,32 @@
 """
-Windows notifications and sounds.
+System tray notifications and sounds.
 """
 
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from utils import clamp01
+
 if TYPE_CHECKING:
-    from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-    from PySide6.QtWidgets import QSystemTrayIcon
+    from PySide6.QtMultimedia import QSoundEffect
+    from PySide6.QtWidgets import QApplication, QSystemTrayIcon
+
+
+_BASE_DIR = Path(__file__).resolve().parent
+
+_APP: "QApplication | None" = None
+
+
+def _app() -> "QApplication | None":
+    """Return the QApplication instance, cached once it exists."""
+    global _APP
+    if _APP is None:
+        try:
+            from PySide6.QtWidgets import QApplication
+        except Exception:
+            return None
+        _APP = QApplication.instance()
+    return _APP
 
 
 _TRAY: "QSystemTrayIcon | None" = None
@@ -20,11 +39,11 @@ def init_tray(icon_path: str | None = None) -> None:
     if _TRAY_INITIALIZED:
         return
     try:
-        from PySide6.QtWidgets import QApplication, QSystemTrayIcon
+        from PySide6.QtWidgets import QSystemTrayIcon
         from PySide6.QtGui import QIcon
     except Exception:
         return
-    app = QApplication.instance()
+    app = _app()
     if app is None:
         return
     if not QSystemTrayIcon.isSystemTrayAvailable():
@@ -53,79 +72,106 @@ def show_notification(title: str, message: str) -> None:
         return
 
 
-_PLAYERS: dict[str, tuple["QMediaPlayer", "QAudioOutput"]] = {}
+_qt_mm = None
+
+
+def _load_qt_mm():
+    """Import QtMultimedia once and cache (QSoundEffect, QUrl)."""
+    global _qt_mm
+    if _qt_mm is None:
+        from PySide6.QtMultimedia import QSoundEffect
+        from PySide6.QtCore import QUrl
+        _qt_mm = (QSoundEffect, QUrl)
+    return _qt_mm
+
+
+# QSoundEffect keeps short PCM clips in memory; no decoder pipeline per play.
+_PLAYERS: dict[str, "QSoundEffect"] = {}
 _SOUND_FILES = {
     "lion": "assets/sounds/lion.wav",
     "mountain": "assets/sounds/mountain.wav",
     "tombi": "assets/sounds/tombi.wav",
     "cuckoo": "assets/sounds/cuckoo.wav",
 }
+_SOUND_PATHS = {key: _BASE_DIR / rel_path for key, rel_path in _SOUND_FILES.items()}
+# Installed assets do not change at runtime; stat them once.
+_EXISTING_SOUNDS: dict[str, Path] = {
+    key: path for key, path in _SOUND_PATHS.items() if path.exists()
+}
 
 
-def play_sound(sound_key: str = "beep", volume: float = 0.9) -> None:
-    """Play finish sound by key (best-effort)."""
-    rel_path = _SOUND_FILES.get(sound_key)
-    if not rel_path:
-        return
+def _create_player(sound_key: str) -> "QSoundEffect | None":
+    """Create and cache the sound effect for a key (no-op if already cached)."""
+    effect = _PLAYERS.get(sound_key)
+    if effect is not None:
+        return effect
+    path = _EXISTING_SOUNDS.get(sound_key)
+    if path is None:
+        return None
+    try:
+        QSoundEffect, QUrl = _load_qt_mm()
+    except Exception:
+        return None
 
-    path = Path(__file__).resolve().parent / rel_path
+    app = _app()
+    if app is None:
+        return None
+    try:
+        effect = QSoundEffect(app)
+        effect.setSource(QUrl.fromLocalFile(str(path)))
+    except Exception:
+        return None
+    _PLAYERS[sound_key] = effect
+    return effect
+
+
+def _beep() -> None:
+    """Platform beep on the GUI thread (best-effort, no worker thread)."""
     try:
-        from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-        from PySide6.QtCore import QUrl
         from PySide6.QtGui import QGuiApplication
-        from PySide6.QtWidgets import QApplication
+        QGuiApplication.beep()
     except Exception:
         return
 
+
+def play_sound(sound_key: str = "beep", volume: float = 0.9) -> None:
+    """Play finish sound by key (best-effort).
+
+    "beep", a missing sound file, or any playback error falls back to the
+    platform beep.
+    """
+    if sound_key != "beep" and sound_key not in _SOUND_PATHS:
+        return
+
     try:
-        if not path.exists():
-            QGuiApplication.beep()
+        effect = _create_player(sound_key) if sound_key != "beep" else None
+        if effect is not None:
+            effect.setVolume(clamp01(volume))
+            # Restart from the beginning if the previous play is still running
+            effect.stop()
+            effect.play()
             return
-
-        player, audio = _PLAYERS.get(sound_key, (None, None))
-        if player is None:
-            app = QApplication.instance()
-            audio = QAudioOutput(app)
-            player = QMediaPlayer(app)
-            player.setAudioOutput(audio)
-            _PLAYERS[sound_key] = (player, audio)
-
-        audio.setVolume(max(0.0, min(1.0, float(volume))))
-         # Always refresh source & restart reliably
-        player.setSource(QUrl.fromLocalFile(str(path)))
-        player.stop()
-        player.setPosition(0)
-        player.play()
     except Exception:
-        try:
-            QGuiApplication.beep()
-        except Exception:
-            return
+        pass
+    _beep()
+
+
+_PREWARM_STAGGER_MS = 100
 
 
 def prewarm_sounds() -> None:
-    """Preload sound players to reduce first-play latency."""
+    """Preload sound effects to reduce first-play latency.
+
+    Player creation is staggered across idle event-loop slots so the
+    per-file setSource() cost never blocks the first paint.
+    """
     try:
-        from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-        from PySide6.QtCore import QUrl
-        from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import QTimer
     except Exception:
         return
 
-    app = QApplication.instance()
-    if app is None:
-        return
-    for sound_key, rel_path in _SOUND_FILES.items():
-        path = Path(__file__).resolve().parent / rel_path
-        if not path.exists():
-            continue
-        if sound_key in _PLAYERS:
-            continue
-        try:
-            audio = QAudioOutput(app)
-            player = QMediaPlayer(app)
-            player.setAudioOutput(audio)
-            player.setSource(QUrl.fromLocalFile(str(path)))
-            _PLAYERS[sound_key] = (player, audio)
-        except Exception:
-            continue
+    for i, sound_key in enumerate(_SOUND_FILES):
+        QTimer.singleShot(
+            _PREWARM_STAGGER_MS * i,
+            lambda k=sound_key: _create_player(k),
+        )
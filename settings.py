@@ -3,8 +3,16 @@ settings.py - load/save settings.json in the app directory.
 """
 
 import json
+import os
 from pathlib import Path
 
+from PySide6.QtCore import QTimer
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 from constants import (
     DEFAULT_WORK_MIN,
     DEFAULT_SHORT_MIN,
@@ -12,9 +20,23 @@ from constants import (
     DEFAULT_THEME,
     MODE_WORK,
 )
+from utils import clamp01, clamp255
 
 _BASE_DIR = Path(__file__).resolve().parent
 SETTINGS_PATH = _BASE_DIR / "settings.json"
+_SAVE_DELAY_MS = 2000
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    _loads = json.loads
+
+    def _dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 _DEFAULTS = {
     "window_x": 100,
@@ -39,6 +61,8 @@ class Settings:
 
     def __init__(self):
         self._data: dict = {}
+        self._dirty = False
+        self._save_timer: QTimer | None = None
         self.load()
 
     def load(self) -> None:
@@ -46,59 +70,50 @@ class Settings:
         self._data = dict(_DEFAULTS)
         if SETTINGS_PATH.exists():
             try:
-                with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                    saved = json.load(f)
-                for key in _DEFAULTS:
-                    if key in saved:
-                        self._data[key] = saved[key]
-            except (json.JSONDecodeError, OSError):
+                saved = _loads(SETTINGS_PATH.read_bytes())
+                self._data = {
+                    **_DEFAULTS,
+                    **{k: saved[k] for k in _DEFAULTS.keys() & saved.keys()},
+                }
+            except (ValueError, OSError, AttributeError):
                 pass
+        self._dirty = False
 
     def save(self) -> None:
-        """Persist settings to settings.json."""
+        """Persist settings to settings.json (atomic tmp + rename)."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        tmp_path = SETTINGS_PATH.with_suffix(".json.tmp")
         try:
-            with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            tmp_path.write_bytes(_dumps(self._data))
+            os.replace(tmp_path, SETTINGS_PATH)
         except OSError:
-            pass
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+        self._dirty = False
+
+    def schedule_save(self) -> None:
+        """Debounced save: rapid changes coalesce into one write."""
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(_SAVE_DELAY_MS)
+            self._save_timer.timeout.connect(self._save_if_dirty)
+        self._save_timer.start()
+
+    def _save_if_dirty(self) -> None:
+        if self._dirty:
+            self.save()
 
     def get(self, key: str):
         return self._data.get(key, _DEFAULTS.get(key))
 
     def set(self, key: str, value) -> None:
         self._data[key] = value
-
-    @property
-    def window_x(self) -> int:
-        return int(self.get("window_x"))
-
-    @window_x.setter
-    def window_x(self, v: int):
-        self.set("window_x", v)
-
-    @property
-    def window_y(self) -> int:
-        return int(self.get("window_y"))
-
-    @window_y.setter
-    def window_y(self, v: int):
-        self.set("window_y", v)
-
-    @property
-    def always_on_top(self) -> bool:
-        return bool(self.get("always_on_top"))
-
-    @always_on_top.setter
-    def always_on_top(self, v: bool):
-        self.set("always_on_top", v)
-
-    @property
-    def sound_on(self) -> bool:
-        return bool(self.get("sound_on"))
-
-    @sound_on.setter
-    def sound_on(self, v: bool):
-        self.set("sound_on", v)
+        self._dirty = True
 
     @property
     def bg_opacity(self) -> int:
@@ -106,15 +121,8 @@ class Settings:
 
     @bg_opacity.setter
     def bg_opacity(self, v: int):
-        self.set("bg_opacity", max(0, min(255, int(v))))
-
-    @property
-    def finish_sound(self) -> str:
-        return str(self.get("finish_sound"))
+        self.set("bg_opacity", clamp255(v))
 
-    @finish_sound.setter
-    def finish_sound(self, v: str):
-        self.set("finish_sound", v)
     @property
     def focus_finish_sound(self) -> str:
         v = self.get("focus_finish_sound")
@@ -145,7 +153,7 @@ class Settings:
             value = float(self.get("sound_volume"))
         except (TypeError, ValueError):
             value = 0.7
-        return max(0.0, min(1.0, value))
+        return clamp01(value)
 
     @sound_volume.setter
     def sound_volume(self, v: float):
@@ -153,44 +161,36 @@ class Settings:
             value = float(v)
         except (TypeError, ValueError):
             value = 0.7
-        self.set("sound_volume", max(0.0, min(1.0, value)))
+        self.set("sound_volume", clamp01(value))
 
-    @property
-    def preset_work(self) -> int:
-        return int(self.get("preset_work"))
 
-    @preset_work.setter
-    def preset_work(self, v: int):
-        self.set("preset_work", v)
+def _make_property(key: str, coerce) -> property:
+    """Build a property that coerces to the default value's type."""
+    default = _DEFAULTS[key]
 
-    @property
-    def preset_short(self) -> int:
-        return int(self.get("preset_short"))
-
-    @preset_short.setter
-    def preset_short(self, v: int):
-        self.set("preset_short", v)
+    def getter(self):
+        return coerce(self._data.get(key, default))
 
-    @property
-    def preset_long(self) -> int:
-        return int(self.get("preset_long"))
+    def setter(self, v):
+        self.set(key, coerce(v))
 
-    @preset_long.setter
-    def preset_long(self, v: int):
-        self.set("preset_long", v)
+    return property(getter, setter)
 
-    @property
-    def last_mode(self) -> str:
-        return str(self.get("last_mode"))
 
-    @last_mode.setter
-    def last_mode(self, v: str):
-        self.set("last_mode", v)
-
-    @property
-    def theme_name(self) -> str:
-        return str(self.get("theme_name"))
+# Plain typed keys; the ones above need clamping or fallbacks.
+_PLAIN_KEYS = (
+    "window_x",
+    "window_y",
+    "always_on_top",
+    "sound_on",
+    "finish_sound",
+    "preset_work",
+    "preset_short",
+    "preset_long",
+    "last_mode",
+    "theme_name",
+)
 
-    @theme_name.setter
-    def theme_name(self, v: str):
-        self.set("theme_name", v)
+for _key in _PLAIN_KEYS:
+    setattr(Settings, _key, _make_property(_key, type(_DEFAULTS[_key])))
+del _key
@@ -3,7 +3,9 @@ Timer engine: state machine and countdown logic.
 UI should communicate via signals only.
 """
 
-from PySide6.QtCore import QObject, QTimer, Signal
+import math
+
+from PySide6.QtCore import QElapsedTimer, QObject, QTimer, Qt, Signal
 
 from constants import (
     MODE_WORK,
@@ -13,6 +15,10 @@ from constants import (
     MAX_DIAL_MIN,
 )
 from settings import Settings
+from utils import clamp
+
+# Ticks may fire a few ms early; don't let that round a second back up.
+_TICK_SLACK_MS = 5
 
 
 class TimerState:
@@ -25,7 +31,7 @@ class TimerState:
 class TimerEngine(QObject):
     """
     Signals:
-      tick(int): remaining seconds changed
+      tick(int): remaining seconds changed; the last signal of any visible change
       finished(str): mode finished
       state_changed(str): state changed
       mode_changed(str): mode changed
@@ -46,10 +52,23 @@ class TimerEngine(QObject):
         self._remaining: int = 0
         self._work_count: int = 0
         self._set_count: int = 0
-
+        # Monotonic anchor while RUNNING (invalid otherwise); the deadline is
+        # _start_remaining seconds after it. QElapsedTimer uses
+        # CLOCK_MONOTONIC / QueryPerformanceCounter, immune to clock changes.
+        self._elapsed = QElapsedTimer()
+        self._start_remaining: int = 0
+
+        # Single-shot, re-armed by _on_tick for the next second boundary
+        # (or for the deadline itself while UI ticks are suspended).
         self._qtimer = QTimer(self)
-        self._qtimer.setInterval(1000)
+        self._qtimer.setTimerType(Qt.PreciseTimer)
+        self._qtimer.setSingleShot(True)
         self._qtimer.timeout.connect(self._on_tick)
+        self._ticks_suspended: bool = False
+
+        # Dial-drag batching: set_duration defers its signal to end_batch().
+        self._suppress_signals: bool = False
+        self._batch_dirty: bool = False
 
     @property
     def mode(self) -> str:
@@ -85,32 +104,53 @@ class TimerEngine(QObject):
     def set_duration(self, seconds: int) -> None:
         """Set duration from dial."""
         max_seconds = MAX_DIAL_MIN * 60
-        clamped = max(0, min(max_seconds, int(seconds)))
+        clamped = clamp(int(seconds), 0, max_seconds)
         self._total_seconds = clamped
         self._remaining = clamped
-        self.tick.emit(self._remaining)
-        self.state_changed.emit(self._state)
+        if self._elapsed.isValid():
+            self._anchor()
+            self._start_ticks()
+        # State is unchanged here; tick alone is enough to repaint.
+        if self._suppress_signals:
+            self._batch_dirty = True
+        else:
+            self.tick.emit(self._remaining)
+
+    def begin_batch(self) -> None:
+        """Defer set_duration signals (e.g. while dragging the dial)."""
+        self._suppress_signals = True
+        self._batch_dirty = False
+
+    def end_batch(self) -> None:
+        """Stop deferring; emit one consolidated update if anything changed."""
+        self._suppress_signals = False
+        if self._batch_dirty:
+            self._batch_dirty = False
+            self.state_changed.emit(self._state)
+            self.tick.emit(self._remaining)
 
     def reset(self) -> None:
         """Reset to 00:00."""
         self._qtimer.stop()
+        self._elapsed.invalidate()
         self._state = TimerState.IDLE
         self._total_seconds = 0
         self._remaining = 0
         self._set_count = 0
-        self.tick.emit(self._remaining)
         self.state_changed.emit(self._state)
+        self.tick.emit(self._remaining)
 
     def set_mode(self, mode: str) -> None:
         """Switch mode and reset to its preset."""
         self._qtimer.stop()
+        self._elapsed.invalidate()
         self._state = TimerState.IDLE
         self._mode = mode
         self._settings.last_mode = mode
         self._load_mode_duration()
         self.mode_changed.emit(self._mode)
-        self.tick.emit(self._remaining)
         self.state_changed.emit(self._state)
+        self.tick.emit(self._remaining)
 
     def _load_mode_duration(self) -> None:
         """Load duration from preset for current mode."""
@@ -127,28 +167,74 @@ class TimerEngine(QObject):
         if self._remaining <= 0:
             return
         self._state = TimerState.RUNNING
-        self._qtimer.start()
+        self._anchor()
+        self._start_ticks()
         self.state_changed.emit(self._state)
 
     def _pause(self) -> None:
         self._qtimer.stop()
+        old = self._remaining
+        self._remaining = self._seconds_left()
+        self._elapsed.invalidate()
         self._state = TimerState.PAUSED
         self.state_changed.emit(self._state)
+        if self._remaining != old:
+            self.tick.emit(self._remaining)
+
+    def suspend_ui_ticks(self) -> None:
+        """Stop per-second ticks; wake once at the deadline instead."""
+        self._ticks_suspended = True
+        if self._state == TimerState.RUNNING:
+            self._start_ticks()
+
+    def resume_ui_ticks(self) -> None:
+        """Catch remaining up from the deadline and restart per-second ticks."""
+        self._ticks_suspended = False
+        if self._state == TimerState.RUNNING:
+            self._on_tick()
+
+    def _start_ticks(self) -> None:
+        """Arm the next wake: the next whole second, or the deadline if suspended."""
+        ms_left = self._ms_left()
+        if self._ticks_suspended:
+            delay = ms_left
+        else:
+            delay = ms_left % 1000
+            if delay <= _TICK_SLACK_MS:
+                delay += 1000
+        self._qtimer.start(max(0, delay))
+
+    def _anchor(self) -> None:
+        """Start counting _remaining down from now."""
+        self._start_remaining = self._remaining
+        self._elapsed.start()
+
+    def _ms_left(self) -> int:
+        return self._start_remaining * 1000 - self._elapsed.elapsed()
+
+    def _seconds_left(self) -> int:
+        """Whole seconds until the deadline (rounded up)."""
+        if not self._elapsed.isValid():
+            return self._remaining
+        return max(0, math.ceil((self._ms_left() - _TICK_SLACK_MS) / 1000))
 
     def _on_tick(self) -> None:
-        """Called every second."""
-        self._remaining -= 1
-        if self._remaining < 0:
-            self._remaining = 0
-        self.tick.emit(self._remaining)
+        """Called at each second boundary; remaining is derived from the deadline."""
+        new_remaining = self._seconds_left()
+        if new_remaining != self._remaining:
+            self._remaining = new_remaining
+            self.tick.emit(self._remaining)
 
         if self._remaining <= 0:
             self._qtimer.stop()
+            self._elapsed.invalidate()
             self._state = TimerState.IDLE
             self.state_changed.emit(self._state)
             self.finished.emit(self._mode)
             self._set_count += 1
             self._advance_mode()
+        elif self._state == TimerState.RUNNING:
+            self._start_ticks()
 
     def _advance_mode(self) -> None:
         """Mode progression: Work -> Short/Long -> Work."""
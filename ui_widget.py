@@ -4,8 +4,9 @@ Main widget for the desktop dial timer.
 from __future__ import annotations
 
 import math
+from types import SimpleNamespace
 
-from PySide6.QtCore import Qt, QPoint, QRectF
+from PySide6.QtCore import Qt, QPoint, QPointF, QRect, QRectF, QLineF
 from PySide6.QtGui import (
     QPainter,
     QPainterPath,
@@ -14,18 +15,18 @@ from PySide6.QtGui import (
     QColor,
     QFont,
     QFontMetrics,
-    QRegion,
     QMouseEvent,
+    QPixmap,
+    QRegion,
     QActionGroup,
 )
-from PySide6.QtWidgets import QWidget, QMenu
+from PySide6.QtWidgets import QWidget, QMenu, QInputDialog
 
 from constants import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
     WINDOW_RADIUS,
     SHADOW_OFFSET,
-    SHADOW_BLUR,
     DISC_MARGIN,
     TICK_LENGTH_MAJOR,
     TICK_LENGTH_MINOR,
@@ -51,10 +52,52 @@ from constants import (
     MAX_DIAL_MIN,
     THEMES,
     DEFAULT_THEME,
+    get_theme,
 )
 from settings import Settings
-from timer_engine import TimerEngine, TimerState
+from timer_engine import TimerEngine
 from notifier import show_notification, play_sound
+from utils import clamp, clamp01
+
+_HALF_PI = math.pi / 2
+_TWO_PI = 2 * math.pi
+_RAD_PER_MIN = _TWO_PI / MAX_DIAL_MIN
+_MIN_PER_RAD = MAX_DIAL_MIN / _TWO_PI
+# Larger hand jumps (reset, preset reload, resume) sweep a wedge of the arc
+# outside the two hand rects, so they repaint the whole dial.
+_MAX_PARTIAL_JUMP_SEC = 2
+
+_CONTEXT_MENU_QSS = """
+QMenu {
+    background-color: #2a2d33;
+    border: 1px solid #3a3e47;
+    border-radius: 6px;
+    padding: 4px;
+    color: #e0e0e5;
+    font-family: "Segoe UI";
+    font-size: 12px;
+}
+QMenu::item {
+    padding: 6px 20px;
+    border-radius: 4px;
+}
+QMenu::item:selected {
+    background-color: #3a3e4a;
+}
+QMenu::item:disabled {
+    color: #666;
+}
+QMenu::separator {
+    height: 1px;
+    background-color: #3a3e47;
+    margin: 2px 8px;
+}
+QMenu::indicator:checked {
+    image: none;
+    border-left: 3px solid #60b48c;
+    padding-left: 2px;
+}
+"""
 
 
 class PomodoroWidget(QWidget):
@@ -72,15 +115,23 @@ class PomodoroWidget(QWidget):
         self._dragging: bool = False
         self._window_drag_offset: QPoint = QPoint(0, 0)
 
+        # Mode label only changes on mode transitions, not per paint.
+        self._label_mode: str = self._engine.mode
+        self._mode_label: str = MODE_LABELS.get(self._label_mode, "")
+        self._painted_set_count: int | None = None
+        # Set while a repaint is queued; cleared in paintEvent.
+        self._pending_update: bool = False
+
+        self._setup_fonts()
         self._setup_window()
         self._ctx_menu: QMenu | None = None
         self._ctx_actions: dict[str, object] = {}
         self._build_context_menu()
 
-        self._engine.tick.connect(self._on_tick)
+        # Every visible change (remaining, mode, set count) ends with a tick;
+        # state itself is not drawn, so tick is the only repaint trigger.
+        self._engine.tick.connect(self._on_engine_changed)
         self._engine.finished.connect(self._on_finished)
-        self._engine.state_changed.connect(self.update)
-        self._engine.mode_changed.connect(self.update)
 
     def _setup_window(self) -> None:
         self.setFixedSize(WINDOW_WIDTH, WINDOW_HEIGHT)
@@ -96,23 +147,191 @@ class PomodoroWidget(QWidget):
         # Restore position
         self.move(self._settings.window_x, self._settings.window_y)
 
-        # Rounded mask
-        self._apply_round_mask()
+        # Fixed-size window outline. The background path doubles as the
+        # antialiased clip for rounded corners (no aliased window mask).
+        self._bg_path = QPainterPath()
+        self._bg_path.addRoundedRect(
+            QRectF(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT),
+            WINDOW_RADIUS, WINDOW_RADIUS,
+        )
+        self._shadow_path = QPainterPath()
+        self._shadow_path.addRoundedRect(
+            QRectF(SHADOW_OFFSET, SHADOW_OFFSET, WINDOW_WIDTH, WINDOW_HEIGHT),
+            WINDOW_RADIUS, WINDOW_RADIUS,
+        )
 
         # Transparent background (for shadow)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-    def _apply_round_mask(self) -> None:
-        path = QPainterPath()
-        path.addRoundedRect(
-            QRectF(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT),
-            WINDOW_RADIUS, WINDOW_RADIUS,
+        # Size is fixed, so dial geometry is computed once.
+        w, h = self.width(), self.height()
+        self._cx, self._cy = w / 2, h / 2
+        self._outer_r = min(w, h) / 2 - DISC_MARGIN - max(TICK_LENGTH_MAJOR, TICK_LENGTH_MINOR) - 2
+        self._inner_r = self._outer_r * 0.52
+        self._disc_rect = QRectF(
+            self._cx - self._outer_r, self._cy - self._outer_r,
+            self._outer_r * 2, self._outer_r * 2,
+        )
+        self._inner_rect = QRectF(
+            self._cx - self._inner_r, self._cy - self._inner_r,
+            self._inner_r * 2, self._inner_r * 2,
+        )
+        self._outer_r_sq = self._outer_r * self._outer_r
+        self._inner_r_sq = self._inner_r * self._inner_r
+        self._hand_len = self._outer_r - 8
+        # (cos, sin) of the hand angle for every whole remaining second.
+        self._hand_trig: tuple[tuple[float, float], ...] = tuple(
+            (math.cos(a), math.sin(a))
+            for a in (self._minutes_to_angle(sec / 60) for sec in range(MAX_DIAL_MIN * 60 + 1))
+        )
+        self._rebuild_tick_cache()
+        self._rebuild_paint_cache()
+
+        # Shadow, background and ticks are rendered into a pixmap; only the
+        # dial area (disc, hand, text) changes while the timer runs.
+        self._static_cache: QPixmap | None = None
+        disc_r = self._outer_r
+        self._dial_rect = QRect(
+            math.floor(w / 2 - disc_r) - 2, math.floor(h / 2 - disc_r) - 2,
+            math.ceil(disc_r * 2) + 4, math.ceil(disc_r * 2) + 4,
         )
-        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
 
-    def _on_tick(self, remaining: int) -> None:
+        # Per-tick invalidation: the hand/arc edge sweep plus the time text.
+        self._last_hand_second: int | None = None
+        fm = self._fm_time
+        digit_w = max(fm.horizontalAdvance(d) for d in "0123456789")
+        time_w = 4 * digit_w + fm.horizontalAdvance(":")
+        baseline = h / 2 + fm.ascent() / 2 - 2
+        self._time_text_rect = QRectF(
+            w / 2 - time_w / 2, baseline - fm.ascent(),
+            time_w, fm.ascent() + fm.descent(),
+        ).adjusted(-2, -2, 2, 2).toAlignedRect()
+
+    def _setup_fonts(self) -> None:
+        self._font_mode = QFont(FONT_FAMILY, FONT_SIZE_MODE, QFont.Medium)
+        self._font_time = QFont(FONT_FAMILY, FONT_SIZE_TIME, QFont.Light)
+        self._font_set = QFont(FONT_FAMILY, FONT_SIZE_SET, QFont.Normal)
+        self._fm_mode = QFontMetrics(self._font_mode)
+        self._fm_time = QFontMetrics(self._font_time)
+        self._fm_set = QFontMetrics(self._font_set)
+        # Text widths memoized by string; the label sets are small.
+        self._mode_width: dict[str, int] = {
+            label: self._fm_mode.horizontalAdvance(label)
+            for label in (*MODE_LABELS.values(), "")
+        }
+        self._time_width_cache: dict[str, int] = {}
+        self._set_width_cache: dict[str, int] = {}
+
+    def _rebuild_tick_cache(self) -> None:
+        w, h = self.width(), self.height()
+        cx, cy = w / 2, h / 2
+        radius = min(w, h) / 2 - DISC_MARGIN
+        self._tick_lines_major: list[QLineF] = []
+        self._tick_lines_minor: list[QLineF] = []
+        for i in range(MAX_DIAL_MIN):
+            angle = math.radians(i * 360.0 / MAX_DIAL_MIN - 90)
+            c, s = math.cos(angle), math.sin(angle)
+            if i % 5 == 0:
+                tick_len, lines = TICK_LENGTH_MAJOR, self._tick_lines_major
+            else:
+                tick_len, lines = TICK_LENGTH_MINOR, self._tick_lines_minor
+            lines.append(QLineF(
+                cx + radius * c, cy + radius * s,
+                cx + (radius - tick_len) * c, cy + (radius - tick_len) * s,
+            ))
+
+    def _rebuild_paint_cache(self) -> None:
+        """Build pens/brushes; they depend only on theme and bg opacity."""
+        theme = self._current_theme()
+        alpha = int(self._settings.bg_opacity)
+
+        def brush(key: str, fallback: QColor, a: int | None = None) -> QBrush:
+            color = theme.get(key, fallback)
+            return QBrush(color if a is None else self._with_alpha(color, a))
+
+        def pen(key: str, fallback: QColor, width: int = 1) -> QPen:
+            qpen = QPen(theme.get(key, fallback), width)
+            qpen.setCapStyle(Qt.RoundCap)
+            return qpen
+
+        self._paint_cache = SimpleNamespace(
+            pen_tick_major=pen("tick_major", C_TICK_MAJOR, TICK_WIDTH_MAJOR),
+            pen_tick_minor=pen("tick_minor", C_TICK_MINOR, TICK_WIDTH_MINOR),
+            brush_shadow=brush("shadow", C_SHADOW, min(alpha, 120)),
+            brush_bg_outer=brush("bg_outer", C_BG_OUTER, alpha),
+            brush_bg_disc=brush("bg_disc", C_BG_DISC, alpha),
+            brush_bg_inner=brush("bg_inner", C_BG_INNER, alpha),
+            brush_arc=brush("arc", C_BG_DISC),
+            pen_hand=pen("hand", C_TEXT_TIME, 2),
+            pen_text_mode=QPen(theme.get("text_mode", C_TEXT_MODE)),
+            pen_text_time=QPen(theme.get("text_time", C_TEXT_TIME)),
+            pen_text_set=QPen(theme.get("text_set", C_TEXT_SET)),
+        )
+
+    def _schedule_update(self) -> None:
+        """Request one repaint, however many engine signals arrive first."""
+        if self._pending_update:
+            return
+        self._pending_update = True
+        # Engine-driven changes only touch the dial area.
+        self.update(self._dial_rect)
+
+    def _invalidate_static_cache(self) -> None:
+        self._static_cache = None
         self.update()
 
+    def _ensure_static_cache(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        cache = self._static_cache
+        # Rebuild when moved to a screen with a different scale factor.
+        if cache is None or cache.devicePixelRatio() != dpr:
+            w, h = self.width(), self.height()
+            pix = QPixmap(round(w * dpr), round(h * dpr))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+            p = QPainter(pix)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setClipPath(self._bg_path)
+            self._draw_shadow(p)
+            self._draw_background(p)
+            self._draw_ticks(p)
+            p.end()
+            self._static_cache = pix
+        return self._static_cache
+
+    def _cossin_for_second(self, remaining: int) -> tuple[float, float]:
+        return self._hand_trig[clamp(remaining, 0, MAX_DIAL_MIN * 60)]
+
+    def _hand_rect(self, remaining: int) -> QRect:
+        """Bounds of the radial line (hand and arc edge) for remaining seconds."""
+        cx, cy = self._cx, self._cy
+        r = self._outer_r
+        c, s = self._cossin_for_second(remaining)
+        end = QPointF(cx + r * c, cy + r * s)
+        # Pen width + antialiasing margin
+        return QRectF(QPointF(cx, cy), end).normalized().adjusted(-3, -3, 3, 3).toAlignedRect()
+
+    def _on_engine_changed(self, remaining: int) -> None:
+        engine = self._engine
+        if engine.mode != self._label_mode:
+            self._label_mode = engine.mode
+            self._mode_label = MODE_LABELS.get(engine.mode, "")
+            self._schedule_update()
+            return
+        last = self._last_hand_second
+        if (self._pending_update or last is None
+                or abs(remaining - last) > _MAX_PARTIAL_JUMP_SEC
+                or engine.set_count != self._painted_set_count):
+            self._schedule_update()
+            return
+        # Only the old/new hand position and the time text changed.
+        region = (
+            QRegion(self._hand_rect(last))
+            .united(self._hand_rect(remaining))
+            .united(self._time_text_rect)
+        )
+        self.update(region)
+
     def _on_finished(self, mode: str) -> None:
         label = MODE_LABELS.get(mode, mode)
         if mode == MODE_WORK:
@@ -138,6 +357,8 @@ class PomodoroWidget(QWidget):
             self._dragging = False
             if self._is_in_dial(self._press_pos):
                 self._drag_mode = "dial"
+                # Dial moves repaint directly; engine signals wait for release.
+                self._engine.begin_batch()
             else:
                 self._drag_mode = "window"
                 self._window_drag_offset = event.position().toPoint()
@@ -168,6 +389,8 @@ class PomodoroWidget(QWidget):
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.LeftButton:
+            if self._drag_mode == "dial":
+                self._engine.end_batch()
             if self._press_pos is not None and not self._dragging and self._is_in_center(self._press_pos):
                 self._engine.start_or_pause()
             self._press_pos = None
@@ -178,6 +401,15 @@ class PomodoroWidget(QWidget):
         else:
             super().mouseReleaseEvent(event)
 
+    def hideEvent(self, event) -> None:
+        # No repaints while hidden; the engine wakes once at the deadline.
+        self._engine.suspend_ui_ticks()
+        super().hideEvent(event)
+
+    def showEvent(self, event) -> None:
+        self._engine.resume_ui_ticks()
+        super().showEvent(event)
+
     def keyPressEvent(self, event) -> None:
         super().keyPressEvent(event)
 
@@ -189,53 +421,30 @@ class PomodoroWidget(QWidget):
     def _update_dial_from_pos(self, pos: QPoint) -> None:
         minutes = self._pos_to_minutes(pos)
         self._engine.set_duration(minutes * 60)
-        self.update()
+        self._schedule_update()
 
     def _pos_to_minutes(self, pos: QPoint) -> int:
-        cx, cy = self.width() / 2, self.height() / 2
-        dx = pos.x() - cx
-        dy = pos.y() - cy
-        ang = math.atan2(dy, dx)  # right = 0
-        ang += math.pi / 2        # 12 o'clock = 0
-        if ang < 0:
-            ang += 2 * math.pi
-        ratio = ang / (2 * math.pi)
-        minutes = round(ratio * MAX_DIAL_MIN)
-        return max(0, min(MAX_DIAL_MIN, minutes))
+        dx = pos.x() - self._cx
+        dy = pos.y() - self._cy
+        # right = 0 -> 12 o'clock = 0, wrapped into [0, 2pi)
+        ang = (math.atan2(dy, dx) + _HALF_PI) % _TWO_PI
+        return clamp(round(ang * _MIN_PER_RAD), 0, MAX_DIAL_MIN)
 
     def _minutes_to_angle(self, minutes: float) -> float:
-        minutes = max(0.0, min(MAX_DIAL_MIN, minutes))
-        ratio = minutes / MAX_DIAL_MIN
-        return ratio * 2 * math.pi - math.pi / 2
+        return clamp(minutes, 0.0, MAX_DIAL_MIN) * _RAD_PER_MIN - _HALF_PI
 
     def _is_in_dial(self, pos: QPoint) -> bool:
-        cx, cy = self.width() / 2, self.height() / 2
-        dx = pos.x() - cx
-        dy = pos.y() - cy
-        r = math.hypot(dx, dy)
-        outer = min(self.width(), self.height()) / 2 - DISC_MARGIN - max(
-            TICK_LENGTH_MAJOR, TICK_LENGTH_MINOR
-        ) - 2
-        return r <= outer
+        dx = pos.x() - self._cx
+        dy = pos.y() - self._cy
+        return dx * dx + dy * dy <= self._outer_r_sq
 
     def _is_in_center(self, pos: QPoint) -> bool:
-        cx, cy = self.width() / 2, self.height() / 2
-        dx = pos.x() - cx
-        dy = pos.y() - cy
-        r = math.hypot(dx, dy)
-        radius = min(self.width(), self.height()) / 2 - DISC_MARGIN - max(
-            TICK_LENGTH_MAJOR, TICK_LENGTH_MINOR
-        ) - 2
-        inner_radius = radius * 0.52
-        return r <= inner_radius
+        dx = pos.x() - self._cx
+        dy = pos.y() - self._cy
+        return dx * dx + dy * dy <= self._inner_r_sq
 
     def _current_theme(self) -> dict:
-        base = THEMES.get(DEFAULT_THEME) or next(iter(THEMES.values()), {})
-        theme = THEMES.get(self._settings.theme_name, base)
-        merged = dict(base) if isinstance(base, dict) else {}
-        if isinstance(theme, dict):
-            merged.update(theme)
-        return merged
+        return get_theme(self._settings.theme_name)
 
     def _with_alpha(self, color: QColor, alpha: int) -> QColor:
         c = QColor(color)
@@ -246,12 +455,18 @@ class PomodoroWidget(QWidget):
         if theme_name not in THEMES:
             theme_name = DEFAULT_THEME
         self._settings.theme_name = theme_name
-        self._settings.save()
-        self.update()
+        self._settings.schedule_save()
+        self._rebuild_paint_cache()
+        self._invalidate_static_cache()
+
+    @staticmethod
+    def _connect_menu_data(menu: QMenu, handler) -> None:
+        """One slot per submenu: pass the triggered action's data() to handler."""
+        menu.triggered.connect(lambda act: handler(act.data()))
 
     def _build_context_menu(self) -> None:
         menu = QMenu(self)
-        menu.setStyleSheet(self._context_menu_stylesheet())
+        menu.setStyleSheet(_CONTEXT_MENU_QSS)
         menu.aboutToShow.connect(self._update_context_menu)
 
         menu.addAction("Reset", self._engine.reset)
@@ -262,18 +477,22 @@ class PomodoroWidget(QWidget):
         for mode_key, mode_label in MODE_LABELS.items():
             act = mode_menu.addAction(mode_label)
             act.setCheckable(True)
-            act.triggered.connect(lambda checked, m=mode_key: self._engine.set_mode(m))
+            act.setData(mode_key)
             mode_actions[mode_key] = act
+        self._connect_menu_data(mode_menu, self._engine.set_mode)
         self._ctx_actions["mode"] = mode_actions
 
         menu.addSeparator()
 
         preset_menu = menu.addMenu("Presets")
         preset_actions = {
-            "work": preset_menu.addAction("Work: 0 min", lambda: self._change_preset("work")),
-            "short": preset_menu.addAction("Short Break: 0 min", lambda: self._change_preset("short")),
-            "long": preset_menu.addAction("Long Break: 0 min", lambda: self._change_preset("long")),
+            "work": preset_menu.addAction("Work: 0 min"),
+            "short": preset_menu.addAction("Short Break: 0 min"),
+            "long": preset_menu.addAction("Long Break: 0 min"),
         }
+        for preset_type, act in preset_actions.items():
+            act.setData(preset_type)
+        self._connect_menu_data(preset_menu, self._change_preset)
         self._ctx_actions["preset"] = preset_actions
 
         menu.addSeparator()
@@ -287,8 +506,9 @@ class PomodoroWidget(QWidget):
             act = theme_menu.addAction(label)
             act.setCheckable(True)
             act.setActionGroup(theme_group)
-            act.triggered.connect(lambda checked, t=theme_key: self._set_theme(t))
+            act.setData(theme_key)
             theme_actions[theme_key] = act
+        self._connect_menu_data(theme_menu, self._set_theme)
         self._ctx_actions["theme"] = theme_actions
 
         menu.addSeparator()
@@ -307,8 +527,9 @@ class PomodoroWidget(QWidget):
             act = focus_sound_menu.addAction(label)
             act.setCheckable(True)
             act.setActionGroup(focus_group)
-            act.triggered.connect(lambda checked, k=key: self._set_focus_finish_sound(k))
+            act.setData(key)
             focus_actions[key] = act
+        self._connect_menu_data(focus_sound_menu, self._set_focus_finish_sound)
         self._ctx_actions["focus_sound"] = focus_actions
 
         break_sound_menu = menu.addMenu("Break Sound")
@@ -319,8 +540,9 @@ class PomodoroWidget(QWidget):
             act = break_sound_menu.addAction(label)
             act.setCheckable(True)
             act.setActionGroup(break_group)
-            act.triggered.connect(lambda checked, k=key: self._set_break_finish_sound(k))
+            act.setData(key)
             break_actions[key] = act
+        self._connect_menu_data(break_sound_menu, self._set_break_finish_sound)
         self._ctx_actions["break_sound"] = break_actions
 
         menu.addSeparator()
@@ -335,8 +557,9 @@ class PomodoroWidget(QWidget):
             act = volume_menu.addAction(label)
             act.setCheckable(True)
             act.setActionGroup(volume_group)
-            act.triggered.connect(lambda *_, val=v: self._set_sound_volume(val))
+            act.setData(v)
             volume_actions[v] = act
+        self._connect_menu_data(volume_menu, self._set_sound_volume)
         self._ctx_actions["volume"] = volume_actions
 
         menu.addSeparator()
@@ -354,8 +577,9 @@ class PomodoroWidget(QWidget):
             act = transparency_menu.addAction(label)
             act.setCheckable(True)
             act.setActionGroup(transparency_group)
-            act.triggered.connect(lambda checked, v=alpha: self._set_bg_opacity(v))
+            act.setData(alpha)
             transparency_actions[alpha] = act
+        self._connect_menu_data(transparency_menu, self._set_bg_opacity)
         self._ctx_actions["transparency"] = transparency_actions
 
         menu.addSeparator()
@@ -423,16 +647,14 @@ class PomodoroWidget(QWidget):
             sound_action.setChecked(self._settings.sound_on)
 
     def _show_context_menu(self, pos: QPoint) -> None:
+        # Menu is built once; aboutToShow syncs checked state and labels.
         if self._ctx_menu is None:
             self._build_context_menu()
-        self._update_context_menu()
         if self._ctx_menu is not None:
             self._ctx_menu.exec(pos)
         return
 
     def _change_preset(self, preset_type: str) -> None:
-        from PySide6.QtWidgets import QInputDialog
-
         current_map = {
             "work": ("Work minutes", self._settings.preset_work),
             "short": ("Short break minutes", self._settings.preset_short),
@@ -455,7 +677,7 @@ class PomodoroWidget(QWidget):
                (preset_type == "short" and self._engine.mode == MODE_SHORT) or \
                (preset_type == "long" and self._engine.mode == MODE_LONG):
                 self._engine.set_mode(self._engine.mode)
-            self._settings.save()
+            self._settings.schedule_save()
 
     def _toggle_always_on_top(self, checked: bool) -> None:
         self._settings.always_on_top = checked
@@ -466,173 +688,117 @@ class PomodoroWidget(QWidget):
             flags &= ~Qt.WindowStaysOnTopHint
         self.setWindowFlags(flags)
         self.show()
-        self._settings.save()
+        self._settings.schedule_save()
 
     def _toggle_sound(self, checked: bool) -> None:
         self._settings.sound_on = checked
-        self._settings.save()
+        self._settings.schedule_save()
 
     def _set_finish_sound(self, key: str) -> None:
         self._settings.finish_sound = key
-        self._settings.save()
+        self._settings.schedule_save()
     
     def _set_focus_finish_sound(self, key: str) -> None:
         self._settings.focus_finish_sound = key
-        self._settings.save()
+        self._settings.schedule_save()
 
     def _set_break_finish_sound(self, key: str) -> None:
         self._settings.break_finish_sound = key
-        self._settings.save()
+        self._settings.schedule_save()
 
     def _set_sound_volume(self, value: float) -> None:
         self._settings.sound_volume = value
-        self._settings.save()
+        self._settings.schedule_save()
 
     def _set_bg_opacity(self, value: int) -> None:
         self._settings.bg_opacity = value
-        self._settings.save()
-        self.update()
+        self._settings.schedule_save()
+        self._rebuild_paint_cache()
+        self._invalidate_static_cache()
 
     def paintEvent(self, event) -> None:
+        self._pending_update = False
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
         p.setRenderHint(QPainter.TextAntialiasing)
+        p.setClipPath(self._bg_path)
 
-        w, h = self.width(), self.height()
-
-        self._draw_shadow(p, w, h)
-        self._draw_background(p, w, h)
-        self._draw_ticks(p, w, h)
-        self._draw_disc(p, w, h)
-        self._draw_hand(p, w, h)
-        self._draw_text(p, w, h)
+        p.drawPixmap(0, 0, self._ensure_static_cache())
+        self._draw_disc(p)
+        self._draw_hand(p)
+        self._draw_text(p)
 
         p.end()
 
-    def _draw_shadow(self, p: QPainter, w: int, h: int) -> None:
-        theme = self._current_theme()
-        alpha = int(self._settings.bg_opacity)
-        shadow_path = QPainterPath()
-        shadow_path.addRoundedRect(
-            QRectF(SHADOW_OFFSET, SHADOW_OFFSET, w, h),
-            WINDOW_RADIUS, WINDOW_RADIUS,
-        )
+    def _draw_shadow(self, p: QPainter) -> None:
         p.save()
         p.setPen(Qt.NoPen)
-        shadow_alpha = min(alpha, 120)
-        p.setBrush(QBrush(self._with_alpha(theme.get("shadow", C_SHADOW), shadow_alpha)))
-        p.drawPath(shadow_path)
+        p.setBrush(self._paint_cache.brush_shadow)
+        p.drawPath(self._shadow_path)
         p.restore()
 
-    def _draw_background(self, p: QPainter, w: int, h: int) -> None:
-        theme = self._current_theme()
-        alpha = int(self._settings.bg_opacity)
-        bg_path = QPainterPath()
-        bg_path.addRoundedRect(
-            QRectF(0, 0, w, h),
-            WINDOW_RADIUS, WINDOW_RADIUS,
-        )
+    def _draw_background(self, p: QPainter) -> None:
         p.save()
         p.setPen(Qt.NoPen)
-        p.setBrush(QBrush(self._with_alpha(theme.get("bg_outer", C_BG_OUTER), alpha)))
-        p.drawPath(bg_path)
+        p.setBrush(self._paint_cache.brush_bg_outer)
+        p.drawPath(self._bg_path)
         p.restore()
 
-    def _draw_ticks(self, p: QPainter, w: int, h: int) -> None:
-        theme = self._current_theme()
-        cx, cy = w / 2, h / 2
-        radius = min(w, h) / 2 - DISC_MARGIN
-
+    def _draw_ticks(self, p: QPainter) -> None:
         p.save()
-        total_minutes = MAX_DIAL_MIN
-        for i in range(total_minutes):
-            angle_deg = i * (360.0 / total_minutes)
-            angle_rad = math.radians(angle_deg - 90)
-
-            is_major = (i % 5 == 0)
-            tick_len = TICK_LENGTH_MAJOR if is_major else TICK_LENGTH_MINOR
-            color = theme.get("tick_major", C_TICK_MAJOR) if is_major else theme.get("tick_minor", C_TICK_MINOR)
-            width = TICK_WIDTH_MAJOR if is_major else TICK_WIDTH_MINOR
-
-            x_outer = cx + radius * math.cos(angle_rad)
-            y_outer = cy + radius * math.sin(angle_rad)
-            x_inner = cx + (radius - tick_len) * math.cos(angle_rad)
-            y_inner = cy + (radius - tick_len) * math.sin(angle_rad)
-
-            pen = QPen(color, width)
-            pen.setCapStyle(Qt.RoundCap)
-            p.setPen(pen)
-            p.drawLine(
-                QPoint(round(x_outer), round(y_outer)),
-                QPoint(round(x_inner), round(y_inner)),
-            )
-
+        p.setPen(self._paint_cache.pen_tick_minor)
+        p.drawLines(self._tick_lines_minor)
+        p.setPen(self._paint_cache.pen_tick_major)
+        p.drawLines(self._tick_lines_major)
         p.restore()
 
-    def _draw_disc(self, p: QPainter, w: int, h: int) -> None:
-        theme = self._current_theme()
-        alpha = int(self._settings.bg_opacity)
-        cx, cy = w / 2, h / 2
-        radius = min(w, h) / 2 - DISC_MARGIN - max(TICK_LENGTH_MAJOR, TICK_LENGTH_MINOR) - 2
-        disc_rect = QRectF(
-            cx - radius, cy - radius,
-            radius * 2, radius * 2,
-        )
+    def _draw_disc(self, p: QPainter) -> None:
+        disc_rect = self._disc_rect
 
         p.save()
         p.setPen(Qt.NoPen)
-        p.setBrush(QBrush(self._with_alpha(theme.get("bg_disc", C_BG_DISC), alpha)))
+        p.setBrush(self._paint_cache.brush_bg_disc)
         p.drawEllipse(disc_rect)
         p.restore()
 
         engine = self._engine
         max_seconds = MAX_DIAL_MIN * 60
         if max_seconds > 0:
-            ratio = max(0.0, min(1.0, engine.remaining / max_seconds))
+            ratio = clamp01(engine.remaining / max_seconds)
         else:
             ratio = 0.0
 
         if ratio > 0.0:
             start_angle_qt16 = 90 * 16
             span_qt16 = -int(ratio * 360 * 16)
-            arc_color = theme.get("arc", C_BG_DISC)
 
             p.save()
             p.setPen(Qt.NoPen)
-            p.setBrush(QBrush(arc_color))
+            p.setBrush(self._paint_cache.brush_arc)
             p.drawPie(disc_rect, start_angle_qt16, span_qt16)
             p.restore()
 
-        inner_radius = radius * 0.52
-        inner_rect = QRectF(
-            cx - inner_radius, cy - inner_radius,
-            inner_radius * 2, inner_radius * 2,
-        )
         p.save()
         p.setPen(Qt.NoPen)
-        p.setBrush(QBrush(self._with_alpha(theme.get("bg_inner", C_BG_INNER), alpha)))
-        p.drawEllipse(inner_rect)
+        p.setBrush(self._paint_cache.brush_bg_inner)
+        p.drawEllipse(self._inner_rect)
         p.restore()
 
-    def _draw_hand(self, p: QPainter, w: int, h: int) -> None:
-        theme = self._current_theme()
-        cx, cy = w / 2, h / 2
-        minutes = max(0.0, min(MAX_DIAL_MIN, self._engine.remaining / 60))
-        angle_rad = self._minutes_to_angle(minutes)
-        length = min(w, h) / 2 - DISC_MARGIN - max(TICK_LENGTH_MAJOR, TICK_LENGTH_MINOR) - 10
-        x = cx + length * math.cos(angle_rad)
-        y = cy + length * math.sin(angle_rad)
+    def _draw_hand(self, p: QPainter) -> None:
+        cx, cy = self._cx, self._cy
+        remaining = self._engine.remaining
+        c, s = self._cossin_for_second(remaining)
+        x = cx + self._hand_len * c
+        y = cy + self._hand_len * s
 
         p.save()
-        pen = QPen(theme.get("hand", C_TEXT_TIME), 2)
-        pen.setCapStyle(Qt.RoundCap)
-        p.setPen(pen)
-        p.drawLine(QPoint(round(cx), round(cy)), QPoint(round(x), round(y)))
+        p.setPen(self._paint_cache.pen_hand)
+        p.drawLine(QLineF(cx, cy, x, y))
         p.restore()
+        self._last_hand_second = remaining
 
-    def _draw_text(self, p: QPainter, w: int, h: int) -> None:
-        theme = self._current_theme()
-        cx, cy = w / 2, h / 2
+    def _draw_text(self, p: QPainter) -> None:
+        cx, cy = self._cx, self._cy
         engine = self._engine
 
         remaining = engine.remaining
@@ -640,14 +806,13 @@ class PomodoroWidget(QWidget):
         ss = remaining % 60
         time_str = f"{mm:02d}:{ss:02d}"
 
-        mode_label = MODE_LABELS.get(engine.mode, "")
-
-        font_mode = QFont(FONT_FAMILY, FONT_SIZE_MODE, QFont.Medium)
+        mode_label = self._mode_label
+        mode_w = self._mode_width.get(mode_label)
+        if mode_w is None:
+            mode_w = self._mode_width[mode_label] = self._fm_mode.horizontalAdvance(mode_label)
         p.save()
-        p.setFont(font_mode)
-        p.setPen(QPen(theme.get("text_mode", C_TEXT_MODE)))
-        fm = QFontMetrics(font_mode)
-        mode_w = fm.horizontalAdvance(mode_label)
+        p.setFont(self._font_mode)
+        p.setPen(self._paint_cache.pen_text_mode)
         p.drawText(
             round(cx - mode_w / 2),
             round(cy - 18),
@@ -655,26 +820,27 @@ class PomodoroWidget(QWidget):
         )
         p.restore()
 
-        font_time = QFont(FONT_FAMILY, FONT_SIZE_TIME, QFont.Light)
+        time_w = self._time_width_cache.get(time_str)
+        if time_w is None:
+            time_w = self._time_width_cache[time_str] = self._fm_time.horizontalAdvance(time_str)
         p.save()
-        p.setFont(font_time)
-        p.setPen(QPen(theme.get("text_time", C_TEXT_TIME)))
-        fm_time = QFontMetrics(font_time)
-        time_w = fm_time.horizontalAdvance(time_str)
+        p.setFont(self._font_time)
+        p.setPen(self._paint_cache.pen_text_time)
         p.drawText(
             round(cx - time_w / 2),
-            round(cy + fm_time.ascent() / 2 - 2),
+            round(cy + self._fm_time.ascent() / 2 - 2),
             time_str,
         )
         p.restore()
 
+        self._painted_set_count = engine.set_count
         set_str = f"Set {engine.set_count + 1}"
-        font_set = QFont(FONT_FAMILY, FONT_SIZE_SET, QFont.Normal)
+        set_w = self._set_width_cache.get(set_str)
+        if set_w is None:
+            set_w = self._set_width_cache[set_str] = self._fm_set.horizontalAdvance(set_str)
         p.save()
-        p.setFont(font_set)
-        p.setPen(QPen(theme.get("text_set", C_TEXT_SET)))
-        fm_set = QFontMetrics(font_set)
-        set_w = fm_set.horizontalAdvance(set_str)
+        p.setFont(self._font_set)
+        p.setPen(self._paint_cache.pen_text_set)
         p.drawText(
             round(cx - set_w / 2),
             round(cy + 36),
@@ -686,36 +852,3 @@ class PomodoroWidget(QWidget):
         pos = self.pos()
         self._settings.window_x = pos.x()
         self._settings.window_y = pos.y()
-
-    def _context_menu_stylesheet(self) -> str:
-        return """
-        QMenu {
-            background-color: #2a2d33;
-            border: 1px solid #3a3e47;
-            border-radius: 6px;
-            padding: 4px;
-            color: #e0e0e5;
-            font-family: "Segoe UI";
-            font-size: 12px;
-        }
-        QMenu::item {
-            padding: 6px 20px;
-            border-radius: 4px;
-        }
-        QMenu::item:selected {
-            background-color: #3a3e4a;
-        }
-        QMenu::item:disabled {
-            color: #666;
-        }
-        QMenu::separator {
-            height: 1px;
-            background-color: #3a3e47;
-            margin: 2px 8px;
-        }
-        QMenu::indicator:checked {
-            image: none;
-            border-left: 3px solid #60b48c;
-            padding-left: 2px;
-        }
-        """
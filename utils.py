@@ -0,0 +1,20 @@
+"""
+Small numeric helpers shared across modules.
+"""
+
+
+def clamp(x, lo, hi):
+    """Clamp x into [lo, hi] without the builtins.max/min dispatch."""
+    return lo if x < lo else hi if x > hi else x
+
+
+def clamp01(x: float) -> float:
+    """Clamp to [0.0, 1.0] as float (volumes, ratios)."""
+    x = float(x)
+    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+
+
+def clamp255(x: int) -> int:
+    """Clamp to [0, 255] as int (alpha channel)."""
+    x = int(x)
+    return 0 if x < 0 else 255 if x > 255 else x